@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import shutil
+from collections import ChainMap
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_ENTRY_ID,
     CONF_AZAN_URL,
     CONF_EXTERNAL_URL,
     CONF_FAJR_URL,
@@ -42,6 +51,7 @@ from .const import (
     DOMAIN,
     PLAYBACK_ANDROID_VLC,
     PLAYBACK_MEDIA_PLAYER,
+    PRAYER_BITS,
     SOUND_OPTION_CUSTOM,
     SOUND_OPTION_FULL,
     SOUND_OPTION_SHORT,
@@ -52,19 +62,38 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
 
+# Seconds after playback starts before the playing state is cleared
+PLAYBACK_RESET_SECONDS = 5 * 60
+
+# Prayers accepted by the play_azan service
+_PLAYABLE_PRAYERS = frozenset({"Fajr", "Dhuhr", "Asr", "Maghrib", "Isha", "Test"})
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
-SERVICE_PLAY_SCHEMA = vol.Schema(
+SERVICE_ENTRY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+    }
+)
+SERVICE_PLAY_SCHEMA = SERVICE_ENTRY_SCHEMA.extend(
     {
-        vol.Required("prayer", default="Test"): vol.In(
-            ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha", "Test"]
-        ),
+        vol.Required("prayer", default="Test"): vol.In(_PLAYABLE_PRAYERS),
     }
 )
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Minaret integration."""
+    _async_register_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Azan Prayer Times from a config entry."""
-    config = {**entry.data, **entry.options}
+    # Options take precedence over data; the entry is reloaded on options
+    # update, so this view never goes stale.
+    config = ChainMap(entry.options, entry.data)
 
     coordinator = AzanCoordinator(hass, config)
     coordinator.config_entry = entry
@@ -73,6 +102,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "config": config,
         "is_playing": False,
         "currently_playing": None,
         "is_downloading": False,
@@ -80,12 +110,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "full_audio_file": None,
         "short_audio_file": None,
         "fajr_audio_file": None,
+        # Prepared audio paths mapped to the filename they are served under
+        "audio_filenames": {},
+        "base_url": None,
         "unsub_timer": None,
         "playback_reset_unsub": None,
+        # Time of the last prayer the scheduler fired; earlier ones are skipped
+        "last_fired_time": None,
+        "update_pending": False,
     }
 
     store = hass.data[DOMAIN][entry.entry_id]
 
+    # A configured external URL only changes with the options, which reload
+    # the entry, so it can be kept. URLs derived from HA's network settings
+    # are resolved at each playback since they can change at any time.
+    if config.get(CONF_PLAYBACK_MODE, PLAYBACK_MEDIA_PLAYER) != PLAYBACK_MEDIA_PLAYER:
+        store["base_url"] = config.get(CONF_EXTERNAL_URL, "").rstrip("/") or None
+
     # Initial data fetch
     await coordinator.async_config_entry_first_refresh()
 
@@ -98,35 +140,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         fajr_url = config.get(CONF_FAJR_URL)
 
         store["is_downloading"] = True
-        if coordinator.data:
-            coordinator.async_set_updated_data(coordinator.data)
+        _async_notify_listeners(hass, store)
+
+        async def _noop() -> None:
+            return None
+
+        # Run both downloads concurrently so one's network transfer overlaps
+        # the other's ffmpeg post-processing.
+        azan_result, fajr_result = await asyncio.gather(
+            hass.async_add_executor_job(_download_audio, hass, azan_url, "azan")
+            if azan_url
+            else _noop(),
+            hass.async_add_executor_job(_download_audio, hass, fajr_url, "fajr_azan")
+            if fajr_url
+            else _noop(),
+            return_exceptions=True,
+        )
 
-        if azan_url:
-            try:
-                path = await hass.async_add_executor_job(
-                    _download_audio, hass, azan_url, "azan"
-                )
-                store["audio_file"] = path
-                _LOGGER.info("Azan audio ready: %s", path)
-            except Exception:
-                _LOGGER.exception("Failed to download azan audio")
+        if isinstance(azan_result, BaseException):
+            _LOGGER.error("Failed to download azan audio", exc_info=azan_result)
+        elif azan_result:
+            _set_audio_file(store, "audio_file", azan_result)
+            _LOGGER.info("Azan audio ready: %s", azan_result)
 
-        if fajr_url:
-            try:
-                path = await hass.async_add_executor_job(
-                    _download_audio, hass, fajr_url, "fajr_azan"
-                )
-                store["fajr_audio_file"] = path
-                _LOGGER.info("Fajr audio ready: %s", path)
-            except Exception:
-                _LOGGER.exception("Failed to download fajr audio")
+        if isinstance(fajr_result, BaseException):
+            _LOGGER.error("Failed to download fajr audio", exc_info=fajr_result)
+        elif fajr_result:
+            _set_audio_file(store, "fajr_audio_file", fajr_result)
+            _LOGGER.info("Fajr audio ready: %s", fajr_result)
 
         # Look for user-provided default files in common locations and copy
         # them into www/azan as internal full/short names. This allows users
         # to drop their MP3s into `/config/media` or `/config/www` and name
         # them as provided below.
         try:
-            audio_dir = Path(hass.config.path("www", "azan"))
+            audio_dir = await hass.async_add_executor_job(_get_audio_dir, hass)
             # Candidate filenames the user might place
             full_names = [
                 "Azhan by Mishray Alafasi.mp3",
@@ -174,20 +222,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             fajr_path = await _find_and_copy(fajr_names, "fajr_azan.mp3")
 
             if full_path:
-                store["full_audio_file"] = full_path
+                _set_audio_file(store, "full_audio_file", full_path)
                 _LOGGER.info("Found default full azan: %s", full_path)
             if short_path:
-                store["short_audio_file"] = short_path
+                _set_audio_file(store, "short_audio_file", short_path)
                 _LOGGER.info("Found default short azan: %s", short_path)
             if fajr_path:
-                store["fajr_audio_file"] = fajr_path
+                _set_audio_file(store, "fajr_audio_file", fajr_path)
                 _LOGGER.info("Found default fajr azan: %s", fajr_path)
         except Exception:
             _LOGGER.exception("Failed to copy default azan files")
 
         store["is_downloading"] = False
-        if coordinator.data:
-            coordinator.async_set_updated_data(coordinator.data)
+        _async_notify_listeners(hass, store)
 
     entry.async_create_background_task(
         hass, _download_audio_background(), "azan_audio_download"
@@ -196,9 +243,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Schedule azan playback
     _schedule_next_prayer(hass, entry)
 
-    # Register services
-    _register_services(hass, entry)
-
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
@@ -228,16 +272,105 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id, None)
-        # Remove services if no more entries
-        if not hass.data[DOMAIN]:
-            for service_name in ("play_azan", "stop_playback", "refresh_times"):
-                hass.services.async_remove(DOMAIN, service_name)
 
     return unloaded
 
 
+@callback
+def _async_notify_listeners(hass: HomeAssistant, store: dict) -> None:
+    """Push a coordinator update to entities, coalesced per loop iteration.
+
+    State changes often come in bursts (download start/end, play start and
+    played_today marking); listeners only need to see the final state once.
+    """
+    if store["update_pending"]:
+        return
+    store["update_pending"] = True
+
+    @callback
+    def _flush() -> None:
+        store["update_pending"] = False
+        coordinator: AzanCoordinator = store["coordinator"]
+        if coordinator.data:
+            coordinator.async_set_updated_data(coordinator.data)
+
+    hass.loop.call_soon(_flush)
+
+
 # --- Audio Download ---
 
+# yt-dlp options shared by every download; `outtmpl` is added per call.
+_YDL_BASE_OPTS: dict = {
+    # Prefer streams that are already MP3: FFmpegExtractAudio stream-copies
+    # those instead of re-encoding, which is the bulk of the download cost.
+    "format": "bestaudio[acodec=mp3]/bestaudio/best",
+    "postprocessors": [
+        {
+            "key": "FFmpegExtractAudio",
+            "preferredcodec": "mp3",
+            "preferredquality": "0",
+        }
+    ],
+    "noplaylist": True,
+    "overwrites": True,
+    "quiet": True,
+    "no_warnings": True,
+    "http_headers": {
+        "User-Agent": (
+            "Mozilla/5.0 (Linux; Android 13) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/121.0.0.0 Mobile Safari/537.36"
+        )
+    },
+    "extractor_args": {
+        "youtube": {
+            "player_client": ["android"]
+        }
+    },
+}
+
+# Audio output directory path per Home Assistant instance
+_AUDIO_DIRS: WeakKeyDictionary[HomeAssistant, Path] = WeakKeyDictionary()
+
+
+def _get_audio_dir(hass: HomeAssistant) -> Path:
+    """Return the `www/azan` audio directory, ensuring it exists (executor thread)."""
+    audio_dir = _AUDIO_DIRS.get(hass)
+    if audio_dir is None:
+        audio_dir = _AUDIO_DIRS[hass] = Path(hass.config.path("www", "azan"))
+    # Cheap and idempotent; recreates the directory if it was removed at runtime
+    audio_dir.mkdir(parents=True, exist_ok=True)
+    return audio_dir
+
+
+# Chunk size for buffered file copies when sendfile is unavailable
+_COPY_BUFSIZE = 64 * 1024
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy `src` to `dst`, using os.sendfile where the platform allows."""
+    # Opening `dst` for writing would truncate `src` if they are the same file
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    with src.open("rb", buffering=_COPY_BUFSIZE) as s, dst.open(
+        "wb", buffering=_COPY_BUFSIZE
+    ) as d:
+        if hasattr(os, "sendfile"):
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Not supported for this file pair; redo with a buffered copy
+                d.seek(0)
+                d.truncate()
+        shutil.copyfileobj(s, d, _COPY_BUFSIZE)
+
 
 def _download_audio(hass: HomeAssistant, url: str, name: str) -> str:
     """Download or use local audio file (runs in executor thread).
@@ -247,94 +380,77 @@ def _download_audio(hass: HomeAssistant, url: str, name: str) -> str:
     `www/azan` as `<name>.mp3`. Otherwise fallback to downloading with
     yt-dlp as before.
     """
-    audio_dir = Path(hass.config.path("www", "azan"))
-    audio_dir.mkdir(parents=True, exist_ok=True)
+    audio_dir = _get_audio_dir(hass)
 
     out_path = audio_dir / f"{name}.mp3"
     marker_path = audio_dir / f".{name}.url"
 
-    # Check cache
+    # Marker holds the download URL, or for local copies the source path
+    # plus a "<mtime_ns> <size>" line describing the source when copied.
+    marker: list[str] = []
     if out_path.exists() and marker_path.exists():
-        existing_url = marker_path.read_text().strip()
-        if existing_url == url:
-            _LOGGER.debug("Audio already cached: %s", name)
-            return str(out_path)
-    _LOGGER.info("Preparing audio: %s -> %s", url, name)
-
-    # Try to resolve `url` as a local file path in several likely places
-    candidates: list[Path] = []
-    try:
-        candidates.append(Path(url))
-    except Exception:
-        pass
-    # Relative to config dir
-    candidates.append(Path(hass.config.path(url)))
-    # Common HA media folders
-    candidates.append(Path(hass.config.path("media", url)))
-    candidates.append(Path(hass.config.path("www", url)))
-    candidates.append(Path(hass.config.path("www", "azan", url)))
+        marker = marker_path.read_text().splitlines()
+
+    # Try to resolve `url` as a local file path in several likely places.
+    # Candidates are built lazily so the first hit stops further stats.
+    def _iter_candidates():
+        yield Path(url)
+        # Relative to config dir
+        yield Path(hass.config.path(url))
+        # Common HA media folders
+        yield Path(hass.config.path("media", url))
+        yield Path(hass.config.path("www", url))
+        yield Path(hass.config.path("www", "azan", url))
 
     local_source: Path | None = None
-    for c in candidates:
-        if c.exists() and c.is_file():
-            local_source = c
-            break
+    if "://" not in url:
+        local_source = next((c for c in _iter_candidates() if c.is_file()), None)
+
+    # Check cache for downloads; local copies are validated against the
+    # source below, even if an older marker only recorded their path
+    if local_source is None and marker == [url]:
+        _LOGGER.debug("Audio already cached: %s", name)
+        return str(out_path)
+    _LOGGER.info("Preparing audio: %s -> %s", url, name)
 
     if local_source:
+        st = local_source.stat()
+        signature = f"{st.st_mtime_ns} {st.st_size}"
+        if marker == [str(local_source), signature] and (
+            out_path.stat().st_size == st.st_size
+        ):
+            _LOGGER.debug("Local audio unchanged, using cached copy: %s", name)
+            return str(out_path)
+
         _LOGGER.info("Using local audio file: %s", local_source)
         try:
-            shutil.copyfile(str(local_source), str(out_path))
+            _fast_copy(local_source, out_path)
         except Exception:
             _LOGGER.exception("Failed to copy local audio file: %s", local_source)
             raise
-        marker_path.write_text(str(local_source))
+        marker_path.write_text(f"{local_source}\n{signature}\n")
         _LOGGER.info("Audio copied: %s", name)
         return str(out_path)
 
     # Fallback: download using yt-dlp
     _LOGGER.info("Downloading audio with yt-dlp: %s -> %s", url, name)
+    # Imported lazily so local-file setups never pay for yt-dlp
     import yt_dlp
 
-    ydl_opts = {
-        "format": "bestaudio/best",
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "0",
-            }
-        ],
-        "outtmpl": str(audio_dir / f"{name}.%(ext)s"),
-        "noplaylist": True,
-        "overwrites": True,
-        "quiet": True,
-        "no_warnings": True,
-        "http_headers": {
-            "User-Agent": (
-                "Mozilla/5.0 (Linux; Android 13) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/121.0.0.0 Mobile Safari/537.36"
-            )        
-        },
-        "extractor_args": {
-            "youtube": {
-                "player_client": ["android"]
-            }
-        },
-    }
-
+    ydl_opts = {**_YDL_BASE_OPTS, "outtmpl": str(audio_dir / f"{name}.%(ext)s")}
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         ydl.download([url])
 
     # yt-dlp may output with different extension before post-processing
     # The final file should be .mp3 after FFmpegExtractAudio
     if not out_path.exists():
-        # Check for file without extension change
-        for f in audio_dir.iterdir():
-            if f.stem == name and f.suffix != ".url" and not f.name.startswith("."):
-                if f.suffix != ".mp3":
-                    shutil.move(str(f), str(out_path))
-                break
+        # Check for file without extension change; only `<name>.<ext>` can
+        # come from our outtmpl, so glob for it instead of scanning the dir
+        for f in audio_dir.glob(f"{name}.*"):
+            if f.suffix in (".mp3", ".url") or f.stem != name:
+                continue
+            shutil.move(str(f), str(out_path))
+            break
 
     if not out_path.exists():
         raise FileNotFoundError(f"Audio file not found after download: {out_path}")
@@ -346,6 +462,55 @@ def _download_audio(hass: HomeAssistant, url: str, name: str) -> str:
 
 # --- Playback ---
 
+# Fixed Android companion app commands; shared across calls, never mutate
+_CMD_SCREEN_ON = {
+    "message": "command_screen_on",
+    "data": {"ttl": 0, "priority": "high"},
+}
+_CMD_STOP_VLC = {
+    "message": "command_media",
+    "data": {
+        "media_command": "stop",
+        "media_package_name": "org.videolan.vlc",
+        "ttl": 0,
+        "priority": "high",
+    },
+}
+
+
+def _resolve_base_url(hass: HomeAssistant, config: Mapping) -> str:
+    """Return the base URL the playback device should fetch audio from."""
+    if config.get(CONF_PLAYBACK_MODE, PLAYBACK_MEDIA_PLAYER) == PLAYBACK_MEDIA_PLAYER:
+        # For media_player, use internal URL is fine
+        try:
+            return get_url(hass, allow_internal=True, prefer_external=False)
+        except Exception:
+            return get_url(hass)
+
+    # For Android, use configured external URL
+    base_url = config.get(CONF_EXTERNAL_URL, "").rstrip("/")
+    if not base_url:
+        try:
+            base_url = get_url(hass, allow_external=True, prefer_external=True)
+        except Exception:
+            base_url = get_url(hass)
+    return base_url
+
+
+def _set_audio_file(store: dict, key: str, path: str) -> None:
+    """Record a prepared audio file in the store."""
+    store[key] = path
+    store["audio_filenames"][path] = os.path.basename(path)
+
+
+def _audio_file_ready(store: dict, path: str) -> bool:
+    """Return True if `path` can be played.
+
+    Files prepared during setup are trusted without touching the disk;
+    anything else falls back to a stat.
+    """
+    return path in store["audio_filenames"] or os.path.exists(path)
+
 
 async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str) -> None:
     """Play the azan audio on the configured device."""
@@ -358,12 +523,13 @@ async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str)
     # Guard: check if already played (prevents double-triggers from race conditions)
     # We add the prayer to `played_today` only after playback successfully starts
     # so that missing audio doesn't permanently mark a prayer as played.
-    if prayer_name != "Test" and coordinator.data:
-        if prayer_name in coordinator.data.played_today:
+    prayer_bit = PRAYER_BITS.get(prayer_name, 0)
+    if prayer_bit and coordinator.data:
+        if coordinator.data.played_today & prayer_bit:
             _LOGGER.debug("Prayer %s already played, skipping duplicate", prayer_name)
             return
 
-    config = {**entry.data, **entry.options}
+    config = store["config"]
     playback_mode = config.get(CONF_PLAYBACK_MODE, PLAYBACK_MEDIA_PLAYER)
     # Per-prayer volume config keys
     volume_key_map = {
@@ -412,48 +578,41 @@ async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str)
     _LOGGER.debug("Selected audio_file for %s: %s", prayer_name, audio_file)
 
     # Fallbacks if chosen file not available
-    if not audio_file or not os.path.exists(audio_file):
+    if not audio_file or not _audio_file_ready(store, audio_file):
         if prayer_name == "Fajr" and store.get("fajr_audio_file"):
             audio_file = store.get("fajr_audio_file")
         else:
             audio_file = store.get("audio_file")
         _LOGGER.debug("Fallback audio_file for %s: %s", prayer_name, audio_file)
 
-    if not audio_file or not os.path.exists(audio_file):
+    if not audio_file or not _audio_file_ready(store, audio_file):
         _LOGGER.error("No audio file available for %s after fallback attempts", prayer_name)
         # Ensure we still schedule the next prayer even if playback failed
         _schedule_next_prayer(hass, entry)
         return
 
-    filename = os.path.basename(audio_file)
+    filename = store["audio_filenames"].get(audio_file) or os.path.basename(audio_file)
     _LOGGER.debug("Audio filename for playback: %s", filename)
 
     # Build media URL
-    if playback_mode == PLAYBACK_MEDIA_PLAYER:
-        # For media_player, use internal URL is fine
-        try:
-            base_url = get_url(hass, allow_internal=True, prefer_external=False)
-        except Exception:
-            base_url = get_url(hass)
-    else:
-        # For Android, use configured external URL
-        base_url = config.get(CONF_EXTERNAL_URL, "").rstrip("/")
-        if not base_url:
-            try:
-                base_url = get_url(hass, allow_external=True, prefer_external=True)
-            except Exception:
-                base_url = get_url(hass)
+    base_url = store["base_url"] or _resolve_base_url(hass, config)
     media_url = f"{base_url}/local/azan/{filename}"
     _LOGGER.debug("Media URL for playback: %s", media_url)
 
+    # Cancel the previous playback's reset before any await, so it cannot
+    # clear the state of this playback once it fires
+    reset_unsub = store.get("playback_reset_unsub")
+    if reset_unsub:
+        reset_unsub()
+        store["playback_reset_unsub"] = None
+
     # Mark as playing
     store["is_playing"] = True
     store["currently_playing"] = prayer_name
     _LOGGER.debug("Set is_playing=True, currently_playing=%s", prayer_name)
 
     # Trigger sensor updates for status change
-    if coordinator.data:
-        coordinator.async_set_updated_data(coordinator.data)
+    _async_notify_listeners(hass, store)
 
     _LOGGER.info("Playing azan for %s: %s (mode: %s)", prayer_name, media_url, playback_mode)
 
@@ -499,15 +658,9 @@ async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str)
                 _LOGGER.error("No notify service configured in config: %s", config)
                 return
 
-            # Wake screen first
-            await hass.services.async_call(
-                "notify",
-                notify_service,
-                {
-                    "message": "command_screen_on",
-                    "data": {"ttl": 0, "priority": "high"},
-                },
-            )
+            # Wake screen first; awaited separately so the device always
+            # receives it before the VLC launch
+            await hass.services.async_call("notify", notify_service, _CMD_SCREEN_ON)
             _LOGGER.debug("Sent command_screen_on to notify service: %s", notify_service)
 
             # Launch VLC with the audio URL
@@ -532,15 +685,14 @@ async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str)
         store["is_playing"] = False
         store["currently_playing"] = None
         # Mark that prayer was not successfully played and reschedule next
-        if coordinator.data:
-            coordinator.async_set_updated_data(coordinator.data)
+        _async_notify_listeners(hass, store)
         _schedule_next_prayer(hass, entry)
         return
 
     # Mark prayer as played (avoid marking Test)
-    if prayer_name != "Test" and coordinator.data:
-        coordinator.data.played_today.add(prayer_name)
-        coordinator.async_set_updated_data(coordinator.data)
+    if prayer_bit and coordinator.data:
+        coordinator.data.played_today |= prayer_bit
+        _async_notify_listeners(hass, store)
         _LOGGER.debug("Marking prayer %s as played_today", prayer_name)
 
     # Reset playing state after 5 minutes
@@ -551,17 +703,12 @@ async def _play_azan(hass: HomeAssistant, entry: ConfigEntry, prayer_name: str)
             store["is_playing"] = False
             store["currently_playing"] = None
             # Trigger sensor update
-            coordinator = store.get("coordinator")
-            if coordinator and coordinator.data:
-                coordinator.async_set_updated_data(coordinator.data)
+            _async_notify_listeners(hass, store)
 
-    reset_unsub = store.get("playback_reset_unsub")
-    if reset_unsub:
-        reset_unsub()
-
-    store["playback_reset_unsub"] = async_track_point_in_time(
-        hass, _reset_playing, dt_util.now() + timedelta(minutes=5)
-    )
+    # A fixed delay needs no wall-clock tracking; a plain loop timer will do
+    store["playback_reset_unsub"] = hass.loop.call_later(
+        PLAYBACK_RESET_SECONDS, _reset_playing, None
+    ).cancel
 
     # Schedule next prayer after this one
     _schedule_next_prayer(hass, entry)
@@ -576,7 +723,7 @@ async def _stop_playback(hass: HomeAssistant, entry: ConfigEntry) -> None:
     store["is_playing"] = False
     store["currently_playing"] = None
 
-    config = {**entry.data, **entry.options}
+    config = store["config"]
     playback_mode = config.get(CONF_PLAYBACK_MODE, PLAYBACK_ANDROID_VLC)
 
     try:
@@ -596,27 +743,13 @@ async def _stop_playback(hass: HomeAssistant, entry: ConfigEntry) -> None:
             # Android VLC mode
             notify_service = config.get(CONF_NOTIFY_SERVICE)
             if notify_service:
-                await hass.services.async_call(
-                    "notify",
-                    notify_service,
-                    {
-                        "message": "command_media",
-                        "data": {
-                            "media_command": "stop",
-                            "media_package_name": "org.videolan.vlc",
-                            "ttl": 0,
-                            "priority": "high",
-                        },
-                    },
-                )
+                await hass.services.async_call("notify", notify_service, _CMD_STOP_VLC)
                 _LOGGER.info("Stopped azan playback via VLC")
     except Exception:
         _LOGGER.exception("Failed to stop playback")
 
     # Trigger sensor update
-    coordinator = store.get("coordinator")
-    if coordinator and coordinator.data:
-        coordinator.async_set_updated_data(coordinator.data)
+    _async_notify_listeners(hass, store)
 
 
 # --- Scheduling ---
@@ -639,25 +772,26 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if not coordinator.data:
         return
 
-    config = {**entry.data, **entry.options}
+    config = store["config"]
     now = dt_util.now()
     _LOGGER.debug("Scheduler: Current time: %s (tz: %s)", now, now.tzinfo)
 
-    # Find next enabled, unplayed prayer
+    # Find next enabled, unplayed prayer, resuming after the last one that
+    # fired. Comparing times rather than list positions stays correct when a
+    # refresh reshapes the list or loads the next day.
     next_prayer = None
-    _LOGGER.debug("Scheduler: Played today set: %s", getattr(coordinator.data, "played_today", set()))
+    last_fired = store["last_fired_time"]
+    # Enabled prayers that have not been played yet
+    pending_mask = coordinator.data.enabled_mask & ~coordinator.data.played_today
+    _LOGGER.debug("Scheduler: Played today mask: %#x, pending mask: %#x", coordinator.data.played_today, pending_mask)
     for prayer in coordinator.data.prayers:
         prayer_time = prayer["time"]
-        _LOGGER.debug("Scheduler: Considering prayer %s at %s (tz: %s)", prayer["name"], prayer_time, getattr(prayer_time, 'tzinfo', None))
-        if not prayer["enabled"]:
+        if last_fired is not None and prayer_time <= last_fired:
             continue
-        if prayer["name"] in coordinator.data.played_today:
-            _LOGGER.debug("Scheduler: Skipping %s because it's in played_today", prayer["name"])
+        _LOGGER.debug("Scheduler: Considering prayer %s at %s (tz: %s)", prayer["name"], prayer_time, getattr(prayer_time, 'tzinfo', None))
+        if not pending_mask & prayer["bit"]:
             continue
         _LOGGER.debug("Considering prayer %s at %s", prayer["name"], prayer["time"])
-        # Make prayer time timezone-aware for comparison
-        if prayer_time.tzinfo is None:
-            prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
         # Offset only applies to Sunrise; other prayers use zero offset
         if prayer["name"] == "Sunrise":
             this_offset = config.get(CONF_OFFSET_MINUTES, DEFAULT_OFFSET_MINUTES)
@@ -670,7 +804,7 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     if next_prayer is None:
         # No more prayers today, schedule a refresh at midnight
-        _LOGGER.debug("Scheduler: No next prayer found; played_today=%s", coordinator.data.played_today)
+        _LOGGER.debug("Scheduler: No next prayer found; played_today=%#x", coordinator.data.played_today)
         tomorrow = (now + timedelta(days=1)).replace(
             hour=0, minute=30, second=0, microsecond=0
         )
@@ -678,8 +812,12 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
         @callback
         def _midnight_refresh(_now):
             """Refresh prayer times at midnight."""
-            hass.async_create_task(coordinator.async_refresh())
-            _schedule_next_prayer(hass, entry)
+            async def _refresh_and_schedule():
+                # Schedule against the new day's times, not yesterday's
+                await coordinator.async_refresh()
+                _schedule_next_prayer(hass, entry)
+
+            hass.async_create_task(_refresh_and_schedule())
 
         store["unsub_timer"] = async_track_point_in_time(
             hass, _midnight_refresh, tomorrow
@@ -687,8 +825,6 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
         return
 
     prayer_time = next_prayer["time"]
-    if prayer_time.tzinfo is None:
-        prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
     # Determine offset for the selected prayer (Sunrise only)
     if next_prayer["name"] == "Sunrise":
         offset_minutes = config.get(CONF_OFFSET_MINUTES, DEFAULT_OFFSET_MINUTES)
@@ -708,8 +844,9 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Trigger azan playback for the scheduled prayer."""
         _LOGGER.info("Scheduler: _prayer_callback triggered for %s", next_prayer["name"])
         prayer_name = next_prayer["name"]
+        store["last_fired_time"] = next_prayer["time"]
         # Guard: check if already played (prevents double-triggers)
-        if coordinator.data and prayer_name in coordinator.data.played_today:
+        if coordinator.data and coordinator.data.played_today & PRAYER_BITS[prayer_name]:
             _LOGGER.debug("Scheduler: Prayer %s already played, skipping", prayer_name)
             _schedule_next_prayer(hass, entry)
             return
@@ -723,28 +860,71 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
 # --- Services ---
 
 
-def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Register integration services."""
+def _loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list[ConfigEntry]:
+    """Return the loaded entries a service call targets.
 
-    async def handle_play_azan(call: ServiceCall) -> None:
-        prayer = call.data.get("prayer", "Test")
-        await _play_azan(hass, entry, prayer)
+    Calls without an entry_id apply to every loaded entry; an entry_id
+    that matches no loaded entry is rejected.
+    """
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    loaded = hass.data.get(DOMAIN, {})
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in loaded and entry_id in (None, entry.entry_id)
+    ]
+    if entry_id is not None and not entries:
+        raise ServiceValidationError(
+            f"No loaded Minaret entry with entry_id {entry_id}"
+        )
+    return entries
 
-    async def handle_stop_playback(call: ServiceCall) -> None:
-        await _stop_playback(hass, entry)
 
-    async def handle_refresh_times(call: ServiceCall) -> None:
+async def _async_handle_play_azan(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the play_azan service."""
+    prayer = call.data.get("prayer", "Test")
+    await asyncio.gather(
+        *(_play_azan(hass, entry, prayer) for entry in _loaded_entries(hass, call))
+    )
+
+
+async def _async_handle_stop_playback(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the stop_playback service."""
+    await asyncio.gather(
+        *(_stop_playback(hass, entry) for entry in _loaded_entries(hass, call))
+    )
+
+
+async def _async_handle_refresh_times(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the refresh_times service."""
+    for entry in _loaded_entries(hass, call):
+        # An entry may have unloaded while an earlier refresh was awaited
         store = hass.data[DOMAIN].get(entry.entry_id)
-        if store:
-            coordinator: AzanCoordinator = store["coordinator"]
-            await coordinator.async_refresh()
-            _schedule_next_prayer(hass, entry)
+        if not store:
+            continue
+        coordinator: AzanCoordinator = store["coordinator"]
+        await coordinator.async_refresh()
+        _schedule_next_prayer(hass, entry)
 
-    if not hass.services.has_service(DOMAIN, "play_azan"):
-        hass.services.async_register(
-            DOMAIN, "play_azan", handle_play_azan, schema=SERVICE_PLAY_SCHEMA
-        )
-    if not hass.services.has_service(DOMAIN, "stop_playback"):
-        hass.services.async_register(DOMAIN, "stop_playback", handle_stop_playback)
-    if not hass.services.has_service(DOMAIN, "refresh_times"):
-        hass.services.async_register(DOMAIN, "refresh_times", handle_refresh_times)
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register integration services once for all config entries."""
+    hass.services.async_register(
+        DOMAIN,
+        "play_azan",
+        partial(_async_handle_play_azan, hass),
+        schema=SERVICE_PLAY_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "stop_playback",
+        partial(_async_handle_stop_playback, hass),
+        schema=SERVICE_ENTRY_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "refresh_times",
+        partial(_async_handle_refresh_times, hass),
+        schema=SERVICE_ENTRY_SCHEMA,
+    )
@@ -9,7 +9,7 @@ from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import ATTR_ENTRY_ID, DOMAIN
 
 
 async def async_setup_entry(
@@ -66,7 +66,7 @@ class AzanTestPlayButton(AzanBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "play_azan",
-            {"prayer": "Test"},
+            {"prayer": "Test", ATTR_ENTRY_ID: self._entry.entry_id},
         )
 
 
@@ -89,5 +89,5 @@ class AzanRefreshButton(AzanBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "refresh_times",
-            {},
+            {ATTR_ENTRY_ID: self._entry.entry_id},
         )
@@ -4,6 +4,9 @@ DEFAULT_VOLUME_LEVEL = 0.4
 
 DOMAIN = "azan"
 
+# Service call attributes
+ATTR_ENTRY_ID = "entry_id"
+
 # Config keys
 CONF_AZAN_URL = "azan_url"
 CONF_FAJR_URL = "fajr_azan_url"
@@ -67,6 +70,9 @@ SOURCE_QATAR_MOI = "qatar_moi"
 # Ordered list of prayers
 PRAYER_ORDER = ["Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib", "Isha"]
 
+# One bit per prayer, following PRAYER_ORDER, for compact per-day sets
+PRAYER_BITS = {name: 1 << i for i, name in enumerate(PRAYER_ORDER)}
+
 PRAYER_ICONS = {
     "Fajr": "mdi:weather-sunset-up",
     "Sunrise": "mdi:weather-sunny",
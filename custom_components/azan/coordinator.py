@@ -10,6 +10,7 @@ import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_CITY,
@@ -18,6 +19,7 @@ from .const import (
     CONF_PRAYER_SOURCE,
     DOMAIN,
     NAME_MAP,
+    PRAYER_BITS,
     PRAYER_ORDER,
     SOURCE_QATAR_MOI,
 )
@@ -32,7 +34,13 @@ class PrayerData:
         """Initialize prayer data."""
         self.prayers = prayers
         self.date = date
-        self.played_today: set[str] = set()
+        # Bitmasks of PRAYER_BITS for enabled prayers and prayers already
+        # played today
+        self.enabled_mask = 0
+        for prayer in prayers:
+            if prayer["enabled"]:
+                self.enabled_mask |= prayer["bit"]
+        self.played_today: int = 0
 
 
 class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
@@ -194,8 +202,11 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
             if name in ("Asr", "Maghrib", "Isha") and hour < 10:
                 hour += 12
 
+            # Attach the HA timezone once here so consumers can compare
+            # against dt_util.now() directly
             prayer_time = now.replace(
-                hour=hour, minute=minute, second=0, microsecond=0
+                hour=hour, minute=minute, second=0, microsecond=0,
+                tzinfo=dt_util.DEFAULT_TIME_ZONE,
             )
 
             prayers.append(
@@ -204,6 +215,7 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
                     "time": prayer_time,
                     "time_str": f"{hour:02d}:{minute:02d}",
                     "enabled": enabled_map.get(name, False),
+                    "bit": PRAYER_BITS[name],
                 }
             )
 
@@ -13,7 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, PRAYER_ICONS, PRAYER_ORDER
+from .const import DOMAIN, PRAYER_BITS, PRAYER_ICONS, PRAYER_ORDER
 from .coordinator import AzanCoordinator
 
 
@@ -111,7 +111,10 @@ class PrayerTimeSensor(AzanBaseSensor):
 
         played = False
         if self.coordinator.data:
-            played = self._prayer_name in self.coordinator.data.played_today
+            played = bool(
+                self.coordinator.data.played_today
+                & PRAYER_BITS.get(self._prayer_name, 0)
+            )
 
         return {
             "enabled": prayer["enabled"],